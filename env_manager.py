@@ -1,12 +1,21 @@
 import os
+import re
+import mmap
 import shutil
 import zipfile
 import tarfile
 import json
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.backends import default_backend
-from cryptography.fernet import Fernet
+import functools
+import contextlib
+import tempfile
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import struct
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from getpass import getpass
 from colorama import Fore, Style
 import base64
@@ -17,147 +26,495 @@ from InquirerPy import inquirer  # Import InquirerPy for interactive prompts
 import colorama
 colorama.init()
 
+# Color codes, resolved once instead of on every message
+RED, GRN, YEL, CYN, RST = Fore.RED, Fore.GREEN, Fore.YELLOW, Fore.CYAN, Style.RESET_ALL
+
 PROJECTS_DIR = 'projects'
+# Directories renamed to '<name>.trash.<8 hex digits>' are being deleted in the background
+TRASH_MARKER = '.trash.'
+TRASH_PATTERN = re.compile(r'\.trash\.[0-9a-f]{8}$')
+# Projects replaced by an import are kept as '<name>.import-backup.<8 hex digits>' until it succeeds
+IMPORT_BACKUP_MARKER = '.import-backup.'
+IMPORT_BACKUP_PATTERN = re.compile(r'\.import-backup\.[0-9a-f]{8}$')
+# Archives are extracted into a uniquely named directory with this prefix
+IMPORT_TEMP_PREFIX = '.import-temp-'
 SALT_LENGTH = 16
 
+ENCRYPTED_SUFFIX = '.encrypted'
+
+# Encrypted files start with a fixed header:
+# MAGIC || format version || algorithm id || salt length || salt
+# Files without it are from before the header existed: salt || Fernet token.
+MAGIC = b'ENVM'
+FORMAT_VERSION = 1
+HEADER_LENGTH = len(MAGIC) + 3  # Fixed part, before the salt
+ALGO_AESGCM_STREAM = 2  # nonce prefix || (length || ciphertext) frame per CHUNK_SIZE of plaintext
+# Stream chunk nonce = prefix || chunk index (4 bytes) || last-chunk flag (1 byte)
+NONCE_PREFIX_LENGTH = 7
+CHUNK_SIZE = 1024 * 1024
+
+# Key derivation functions: PBKDF2 for headerless Fernet files, scrypt for ENVM files
+KDF_PBKDF2 = 1
+KDF_SCRYPT = 2
+
+# Leading bytes of the archive formats import_projects understands
+ARCHIVE_SIGNATURES = [
+    (b'PK\x03\x04', 'zip'),
+    (b'PK\x05\x06', 'zip'),  # Empty ZIP archive
+    (b'\x1f\x8b', 'gz'),
+    (b'BZh', 'bz2'),
+    (b'\xfd7zXZ\x00', 'xz'),
+]
+
+# Batches smaller than this are processed serially; below it, starting
+# worker processes costs more than the encryption itself
+PARALLEL_MIN_BYTES = 1024 * 1024
+
+# scrypt cost parameters (~32 MiB of memory per derivation)
+SCRYPT_N = 2 ** 15
+SCRYPT_R = 8
+SCRYPT_P = 1
+SCRYPT_MAXMEM = 64 * 1024 * 1024
+
 # Supported .env file extensions
 ENV_EXTENSIONS = ['.env', '.env.local', '.env.development', '.env.production']
+ENV_SET = frozenset(ENV_EXTENSIONS)
+ENV_ENC_SET = frozenset(ext + ENCRYPTED_SUFFIX for ext in ENV_EXTENSIONS)
 
 def ensure_projects_directory():
-    """Create a projects directory if it doesn't exist."""
+    """Create a projects directory if it doesn't exist and sweep leftover trash and imports."""
     if not os.path.exists(PROJECTS_DIR):
         os.makedirs(PROJECTS_DIR)
+        return
+
+    # Deletions and imports interrupted by a previous exit leave their working entries behind
+    with os.scandir(PROJECTS_DIR) as it:
+        leftovers = [entry for entry in it if is_internal(entry.name)]
+    for entry in leftovers:
+        if IMPORT_BACKUP_PATTERN.search(entry.name):
+            try:
+                restore_import_backup(entry.path)
+            except OSError:
+                pass  # Stays hidden and is retried on the next start
+        elif entry.is_dir():
+            _background_rmtree(entry.path)
+
+def is_trash(name):
+    """Return True if name is a directory name made by discard_directory."""
+    return TRASH_PATTERN.search(name) is not None
+
+def is_internal(name):
+    """Return True if name is a trash, import backup or import extraction entry rather than a project."""
+    return is_trash(name) or IMPORT_BACKUP_PATTERN.search(name) is not None or name.startswith(IMPORT_TEMP_PREFIX)
+
+def _background_rmtree(path):
+    threading.Thread(target=shutil.rmtree, args=(path,), kwargs={'ignore_errors': True}, daemon=True).start()
+
+def discard_directory(path):
+    """Remove a directory without blocking on the delete.
+
+    The directory is renamed to a quarantine name straight away and the tree
+    is removed by a background thread. Anything still left when the program
+    exits is swept by ensure_projects_directory on the next start.
+    """
+    trash_path = path + TRASH_MARKER + secrets.token_hex(4)
+    invalidate_project_cache()
+    try:
+        os.rename(path, trash_path)
+    except OSError:
+        shutil.rmtree(path)  # e.g. a file is held open on Windows; delete in place
+        return
+    _background_rmtree(trash_path)
+
+def remove_entry(path):
+    """Remove a top-level entry of the projects directory, whether a directory or a file."""
+    if os.path.isdir(path) and not os.path.islink(path):
+        discard_directory(path)
+    else:
+        os.remove(path)
+
+def restore_import_backup(backup):
+    """Put an entry replaced by an unfinished import back under its own name."""
+    destination = IMPORT_BACKUP_PATTERN.sub('', backup)
+    if os.path.lexists(destination):
+        remove_entry(destination)
+    os.replace(backup, destination)
+
+# Cached result of list_projects and the projects directory mtime it was read at
+_project_cache = None
+_project_cache_mtime = None
+
+def invalidate_project_cache():
+    """Force the next list_projects call to rescan the projects directory."""
+    global _project_cache
+    _project_cache = None
 
 def list_projects():
-    """List all available projects from the filesystem."""
-    return [name for name in os.listdir(PROJECTS_DIR) if os.path.isdir(os.path.join(PROJECTS_DIR, name))]
+    """List all available projects from the filesystem.
+
+    The listing is cached until the projects directory's modification time
+    changes or the cache is invalidated after a create, delete or import.
+    """
+    global _project_cache, _project_cache_mtime
+    mtime = os.stat(PROJECTS_DIR).st_mtime_ns
+    if _project_cache is None or _project_cache_mtime != mtime:
+        with os.scandir(PROJECTS_DIR) as it:
+            _project_cache = [entry.name for entry in it if not is_internal(entry.name) and entry.is_dir()]
+        _project_cache_mtime = mtime
+    return list(_project_cache)
+
+def scan_env_files(directory, names=ENV_SET):
+    """Return the directory entries whose names are in names, using a single scandir pass."""
+    try:
+        with os.scandir(directory) as it:
+            return [entry for entry in it if entry.name in names and entry.is_file()]
+    except OSError:
+        return []
 
 def create_project(project_name, project_path):
     """Create a new project directory and copy all .env files."""
     project_dir = os.path.join(PROJECTS_DIR, project_name)
     if os.path.exists(project_dir):
-        print(f"{Fore.YELLOW}Warning: Project '{project_name}' already exists. Overwriting it may lead to loss of data.{Style.RESET_ALL}")
-        overwrite_choice = input(f"{Fore.YELLOW}Do you want to continue? (Y/n) [{Fore.GREEN}Y{Fore.YELLOW}]: {Style.RESET_ALL}").strip().lower() or 'y'
+        print(f"{YEL}Warning: Project '{project_name}' already exists. Overwriting it may lead to loss of data.{RST}")
+        overwrite_choice = input(f"{YEL}Do you want to continue? (Y/n) [{GRN}Y{YEL}]: {RST}").strip().lower() or 'y'
         if overwrite_choice != 'y':
-            print(f"{Fore.RED}Aborted project creation.{Style.RESET_ALL}")
+            print(f"{RED}Aborted project creation.{RST}")
             return
 
     os.makedirs(project_dir, exist_ok=True)
+    invalidate_project_cache()
 
-    print(f"{Fore.CYAN}Copying .env files from '{project_path}'...{Style.RESET_ALL}")
+    print(f"{CYN}Copying .env files from '{project_path}'...{RST}")
     
-    files_copied = False
-
-    for ext in ENV_EXTENSIONS:
-        env_file_path = os.path.join(project_path, ext)
-        if os.path.exists(env_file_path):
-            shutil.copy(env_file_path, project_dir)
-            print(f"{Fore.GREEN}Copied '{ext}' to project '{project_name}'.{Style.RESET_ALL}")
-            files_copied = True
+    copied_file_paths = []
+
+    for entry in scan_env_files(project_path):
+        copied_file_path = os.path.join(project_dir, entry.name)
+        # copy() goes through copyfile(), which uses the kernel's zero-copy path on Linux,
+        # and keeps the source's permission bits on the secrets
+        shutil.copy(entry.path, copied_file_path)
+        copied_file_paths.append(copied_file_path)
+        print(f"{GRN}Copied '{entry.name}' to project '{project_name}'.{RST}")
     
-    if not files_copied:
-        print(f"{Fore.RED}No .env file found at '{project_path}' with supported extensions: {', '.join(ENV_EXTENSIONS)}.{Style.RESET_ALL}")
+    if not copied_file_paths:
+        print(f"{RED}No .env file found at '{project_path}' with supported extensions: {', '.join(ENV_EXTENSIONS)}.{RST}")
         # Clean up the created directory and exit
-        shutil.rmtree(project_dir)
+        discard_directory(project_dir)
         return
 
     # Encrypt files if user chooses to do so
-    encrypt_choice = input(f"{Fore.YELLOW}Do you want to encrypt the copied files? (Y/n) [{Fore.GREEN}Y{Fore.YELLOW}]: {Style.RESET_ALL}").strip().lower() or 'y'
+    encrypt_choice = input(f"{YEL}Do you want to encrypt the copied files? (Y/n) [{GRN}Y{YEL}]: {RST}").strip().lower() or 'y'
     if encrypt_choice == 'y':
         # Prompt for password
-        password = getpass(f"{Fore.YELLOW}Enter a password to encrypt the copied files: {Style.RESET_ALL}")
-        confirm_password = getpass(f"{Fore.YELLOW}Confirm the password: {Style.RESET_ALL}")
+        password = getpass(f"{YEL}Enter a password to encrypt the copied files: {RST}")
+        confirm_password = getpass(f"{YEL}Confirm the password: {RST}")
 
         if password != confirm_password:
-            print(f"{Fore.RED}Passwords do not match. Aborting encryption and cleaning up.{Style.RESET_ALL}")
-            shutil.rmtree(project_dir)  # Clean up on password mismatch
+            print(f"{RED}Passwords do not match. Aborting encryption and cleaning up.{RST}")
+            discard_directory(project_dir)  # Clean up on password mismatch
             return
 
-        for ext in ENV_EXTENSIONS:
-            copied_file_path = os.path.join(project_dir, ext)
-            if os.path.exists(copied_file_path):
-                encrypt_file(copied_file_path, password)
+        encrypt_files(copied_file_paths, password)
 
         # Prompt for deletion of unencrypted files
-        delete_choice = input(f"{Fore.YELLOW}Do you want to delete the unencrypted files? (Y/n) [{Fore.GREEN}Y{Fore.YELLOW}]: {Style.RESET_ALL}").strip().lower() or 'y'
+        delete_choice = input(f"{YEL}Do you want to delete the unencrypted files? (Y/n) [{GRN}Y{YEL}]: {RST}").strip().lower() or 'y'
         if delete_choice == 'y':
-            for ext in ENV_EXTENSIONS:
-                copied_file_path = os.path.join(project_dir, ext)
-                if os.path.exists(copied_file_path):
-                    os.remove(copied_file_path)
-                    print(f"{Fore.GREEN}Deleted unencrypted file '{copied_file_path}'.{Style.RESET_ALL}")
-
-def encrypt_file(file_path, password):
-    """Encrypt a file using a provided password."""
-    salt = secrets.token_bytes(SALT_LENGTH)
-    key = derive_key(password, salt)
-    fernet = Fernet(key)
+            for copied_file_path in copied_file_paths:
+                os.remove(copied_file_path)
+                print(f"{GRN}Deleted unencrypted file '{copied_file_path}'.{RST}")
 
+@contextlib.contextmanager
+def read_buffer(file_path):
+    """Yield the contents of a file as a read-only mmap.
+
+    Empty files cannot be mapped and are yielded as empty bytes instead.
+    """
     with open(file_path, 'rb') as file:
-        original = file.read()
+        if os.fstat(file.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+@contextlib.contextmanager
+def atomic_writer(file_path, size_hint=0):
+    """Yield a file that replaces file_path in one step once the block completes.
+
+    Data goes to a temporary file which is only moved over file_path on
+    success, so a failure never leaves a partially written file behind.
+    """
+    temp_path = f"{file_path}.{secrets.token_hex(4)}.tmp"
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        if size_hint and hasattr(os, 'posix_fallocate'):
+            try:
+                os.posix_fallocate(fd, 0, size_hint)
+            except OSError:
+                pass  # Not supported by every filesystem; the writes below still work
+        with os.fdopen(fd, 'wb') as file:
+            yield file
+            file.truncate()  # Drop any preallocated space the writes did not use
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def chunk_nonce(nonce_prefix, index, last):
+    """Build the nonce of one stream chunk; the flag stops a truncated stream from authenticating."""
+    return bytes(nonce_prefix) + struct.pack('>IB', index, last)
+
+def encrypt_stream(aead, nonce_prefix, header, source):
+    """Yield the framed, encrypted chunks of a file object, CHUNK_SIZE bytes of plaintext at a time."""
+    index = 0
+    chunk = source.read(CHUNK_SIZE)
+    while True:
+        # Read one chunk ahead to know whether this one is the last
+        next_chunk = source.read(CHUNK_SIZE)
+        last = not next_chunk
+        sealed = aead.encrypt(chunk_nonce(nonce_prefix, index, last), chunk, header)
+        yield struct.pack('<I', len(sealed))
+        yield sealed
+        if last:
+            return
+        chunk = next_chunk
+        index += 1
+
+def decrypt_stream(header, body, password, salt):
+    """Yield the decrypted chunks of an ALGO_AESGCM_STREAM body."""
+    aead = get_cipher(password, salt)
+    nonce_prefix = body[:NONCE_PREFIX_LENGTH]
+    offset = NONCE_PREFIX_LENGTH
+    index = 0
+    while True:
+        if offset + 4 > len(body):
+            raise ValueError("encrypted data is truncated")
+        (length,) = struct.unpack_from('<I', body, offset)
+        offset += 4
+        if offset + length > len(body):
+            raise ValueError("encrypted data is truncated")
+        last = offset + length == len(body)
+        try:
+            chunk = aead.decrypt(chunk_nonce(nonce_prefix, index, last), body[offset:offset + length], header)
+        except InvalidTag:
+            raise ValueError("wrong password or corrupted file") from None
+        yield chunk
+        if last:
+            return
+        offset += length
+        index += 1
+
+def decrypt_fernet(token, password, salt):
+    """Decrypt the Fernet token of a file written before the ENVM header existed."""
+    key = derive_key(password, salt, KDF_PBKDF2)
+    try:
+        return Fernet(base64.urlsafe_b64encode(key)).decrypt(bytes(token))
+    except InvalidToken:
+        raise ValueError("wrong password or corrupted file") from None
+
+def make_header(salt):
+    """Build the file header for new encrypted files using salt."""
+    return MAGIC + bytes([FORMAT_VERSION, ALGO_AESGCM_STREAM, len(salt)]) + salt
+
+def make_encryptor(key, salt):
+    """Return encrypt_file with the cipher and header for one key and salt already bound."""
+    return functools.partial(encrypt_file, aead=AESGCM(key), header=make_header(salt))
+
+def encrypt_file(file_path, aead, header):
+    """Encrypt a file using a prepared AES-GCM cipher and the header carrying its salt.
+
+    The file is processed CHUNK_SIZE bytes at a time, so memory use stays
+    flat however large the file is.
+    """
+    nonce_prefix = secrets.token_bytes(NONCE_PREFIX_LENGTH)
+    encrypted_file_path = file_path + ENCRYPTED_SUFFIX
+
+    with open(file_path, 'rb') as source:
+        size = os.fstat(source.fileno()).st_size
+        chunks = max(1, -(-size // CHUNK_SIZE))
+        with atomic_writer(encrypted_file_path, len(header) + NONCE_PREFIX_LENGTH + size + chunks * (4 + 16)) as out:
+            out.write(header + nonce_prefix)
+            # The header is authenticated along with every chunk
+            for frame in encrypt_stream(aead, nonce_prefix, header, source):
+                out.write(frame)
+
+    print(f"{GRN}File '{file_path}' encrypted successfully as '{encrypted_file_path}'.{RST}")
+
+@functools.lru_cache(maxsize=8)
+def derive_key(password, salt, kdf=KDF_SCRYPT):
+    """Derive a key from a password and salt using scrypt or PBKDF2-HMAC-SHA256.
+
+    New files use scrypt; PBKDF2 is kept so files written before the ENVM
+    header existed can still be decrypted. Results are cached so files sharing a
+    salt only pay for one derivation.
+    """
+    if kdf == KDF_SCRYPT:
+        key = hashlib.scrypt(password.encode(), salt=salt, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P,
+                             maxmem=SCRYPT_MAXMEM, dklen=32)
+    elif kdf == KDF_PBKDF2:
+        key = hashlib.pbkdf2_hmac('sha256', password.encode(), salt, 100000, dklen=32)
+    else:
+        raise ValueError(f"unknown key derivation function id {kdf}")
+    return key
+
+@functools.lru_cache(maxsize=4)
+def get_cipher(password, salt):
+    """Return the AES-GCM cipher for a password and salt, reused across a batch of files."""
+    return AESGCM(derive_key(password, salt, KDF_SCRYPT))
+
+def clear_key_cache():
+    """Drop cached keys and ciphers so they are not kept alive longer than needed."""
+    get_cipher.cache_clear()
+    derive_key.cache_clear()
+
+def split_encrypted(data):
+    """Split encrypted file contents into (kdf, salt, header, body).
+
+    header is None for files written before the ENVM header existed, which
+    are just the salt followed by a Fernet token.
+    """
+    if data[:len(MAGIC)] == MAGIC:
+        if len(data) < HEADER_LENGTH:
+            raise ValueError("encrypted data is truncated")
+        version, algo, salt_length = data[len(MAGIC)], data[len(MAGIC) + 1], data[len(MAGIC) + 2]
+        if version != FORMAT_VERSION:
+            raise ValueError(f"unsupported file format version {version}")
+        if algo != ALGO_AESGCM_STREAM:
+            raise ValueError(f"unsupported encryption algorithm id {algo}")
+        header_length = HEADER_LENGTH + salt_length
+        if header_length > len(data):
+            raise ValueError("encrypted data is truncated")
+        return KDF_SCRYPT, data[HEADER_LENGTH:header_length], data[:header_length], data[header_length:]
+    if len(data) <= SALT_LENGTH:
+        raise ValueError("encrypted data is truncated")
+    return KDF_PBKDF2, data[:SALT_LENGTH], None, data[SALT_LENGTH:]
+
+def decrypt_data(data, password):
+    """Yield the decrypted contents of an encrypted file, in chunks for ENVM files."""
+    _, salt, header, body = split_encrypted(data)
+    if header is None:
+        yield decrypt_fernet(body, password, bytes(salt))
+    else:
+        yield from decrypt_stream(header, body, password, bytes(salt))
+
+def decrypt_file(file_path, password):
+    """Decrypt an encrypted file using a provided password."""
+    if file_path.endswith(ENCRYPTED_SUFFIX):
+        decrypted_file_path = file_path[:-len(ENCRYPTED_SUFFIX)]
+    else:
+        decrypted_file_path = file_path + '.decrypted'
 
-    encrypted = fernet.encrypt(original)
+    with read_buffer(file_path) as data:
+        # The handler must finish inside the with block so the traceback
+        # releases its views of the mapping before it is closed.
+        try:
+            with atomic_writer(decrypted_file_path) as out:
+                for chunk in decrypt_data(memoryview(data), password):
+                    out.write(chunk)
+        except Exception as e:
+            print(f"{RED}Decryption failed: {e}{RST}")
+            return
 
-    encrypted_file_path = file_path + '.encrypted'
-    with open(encrypted_file_path, 'wb') as encrypted_file:
-        encrypted_file.write(salt + encrypted)  # Prepend salt to the encrypted data
+    print(f"{GRN}File '{file_path}' decrypted successfully as '{decrypted_file_path}'.{RST}")
 
-    print(f"{Fore.GREEN}File '{file_path}' encrypted successfully as '{encrypted_file_path}'.{Style.RESET_ALL}")
+# Per-process state set up by the pool initializers below
+_worker_state = {}
 
-def derive_key(password, salt):
-    """Derive a key from a password and salt using PBKDF2HMAC."""
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=32,
-        salt=salt,
-        iterations=100000,
-        backend=default_backend()
-    )
-    return base64.urlsafe_b64encode(kdf.derive(password.encode()))
+def _init_encrypt_worker(key, salt):
+    _worker_state['encrypt'] = make_encryptor(key, salt)
 
-def decrypt_file(file_path, password):
-    """Decrypt an encrypted file using a provided password."""
-    with open(file_path, 'rb') as file:
-        data = file.read()
-    
-    salt = data[:SALT_LENGTH]
-    encrypted = data[SALT_LENGTH:]
+def _encrypt_worker(file_path):
+    _worker_state['encrypt'](file_path)
 
-    key = derive_key(password, salt)
-    fernet = Fernet(key)
+def _init_decrypt_worker(password):
+    _worker_state['password'] = password
 
-    try:
-        decrypted = fernet.decrypt(encrypted)
-    except Exception as e:
-        print(f"{Fore.RED}Decryption failed: {e}{Style.RESET_ALL}")
-        return
+def _decrypt_worker(file_path):
+    decrypt_file(file_path, _worker_state['password'])
+
+def use_process_pool(file_paths):
+    """Return True if a batch is large enough to be worth spreading across processes."""
+    return len(file_paths) > 1 and sum(os.path.getsize(path) for path in file_paths) >= PARALLEL_MIN_BYTES
 
-    decrypted_file_path = file_path.replace('.encrypted', '')
-    with open(decrypted_file_path, 'wb') as decrypted_file:
-        decrypted_file.write(decrypted)
+def encrypt_files(file_paths, password):
+    """Encrypt several files with a single key derived from the password.
 
-    print(f"{Fore.GREEN}File '{file_path}' decrypted successfully as '{decrypted_file_path}'.{Style.RESET_ALL}")
+    All files share one salt, so the key is derived only once. Large batches
+    are spread across worker processes, which receive the derived key rather
+    than the password.
+    """
+    salt = secrets.token_bytes(SALT_LENGTH)
+    key = derive_key(password, salt, KDF_SCRYPT)
+
+    if use_process_pool(file_paths):
+        with ProcessPoolExecutor(max_workers=min(len(file_paths), os.cpu_count() or 1),
+                                 initializer=_init_encrypt_worker, initargs=(key, salt)) as executor:
+            list(executor.map(_encrypt_worker, file_paths))
+    else:
+        encrypt = make_encryptor(key, salt)
+        for file_path in file_paths:
+            encrypt(file_path)
+
+def read_key_params(file_path):
+    """Return the KDF id and salt of an encrypted file without reading its body."""
+    with open(file_path, 'rb') as file:
+        kdf, salt, _, _ = split_encrypted(file.read(HEADER_LENGTH + 255))
+    return kdf, salt
+
+def decrypt_files(file_paths, password):
+    """Decrypt several files with the same password, in parallel for large batches.
+
+    Where workers are forked, the cipher or key for every distinct salt in the
+    batch is set up once here first, under the same cache entries decrypt_file
+    looks up, and the workers inherit the warm cache instead of each
+    repeating the derivation. Spawned workers start with an empty
+    cache, so warming it here would only add a derivation.
+    """
+    if use_process_pool(file_paths):
+        if multiprocessing.get_start_method() == 'fork':
+            key_params = set()
+            for file_path in file_paths:
+                try:
+                    key_params.add(read_key_params(file_path))
+                except (OSError, ValueError):
+                    pass  # Unreadable or malformed; decrypt_file reports it for that file
+            for kdf, salt in key_params:
+                if kdf == KDF_SCRYPT:
+                    get_cipher(password, salt)
+                else:
+                    derive_key(password, salt, KDF_PBKDF2)
+        with ProcessPoolExecutor(max_workers=min(len(file_paths), os.cpu_count() or 1),
+                                 initializer=_init_decrypt_worker, initargs=(password,)) as executor:
+            list(executor.map(_decrypt_worker, file_paths))
+    else:
+        for file_path in file_paths:
+            decrypt_file(file_path, password)
 
 def delete_project(project_name):
     """Delete a project and its directory."""
     project_dir = os.path.join(PROJECTS_DIR, project_name)
     if os.path.exists(project_dir):
-        shutil.rmtree(project_dir)
-        print(f"{Fore.GREEN}Deleted project '{project_name}' and its directory.{Style.RESET_ALL}")
+        discard_directory(project_dir)
+        print(f"{GRN}Deleted project '{project_name}' and its directory.{RST}")
     else:
-        print(f"{Fore.RED}Project '{project_name}' does not exist.{Style.RESET_ALL}")
+        print(f"{RED}Project '{project_name}' does not exist.{RST}")
 
 def view_encrypted_files(project_name):
     """Display all encrypted .env files for the selected project."""
     project_dir = os.path.join(PROJECTS_DIR, project_name)
-    encrypted_files = [f for f in os.listdir(project_dir) if f.endswith('.encrypted')]
+    encrypted_files = [entry.name for entry in scan_env_files(project_dir, ENV_ENC_SET)]
     
     if encrypted_files:
-        print(f"{Fore.CYAN}Encrypted files for project '{project_name}':{Style.RESET_ALL}")
+        print(f"{CYN}Encrypted files for project '{project_name}':{RST}")
         for file in encrypted_files:
             print(f" - {file}")
     else:
-        print(f"{Fore.RED}No encrypted files found for project '{project_name}'.{Style.RESET_ALL}")
+        print(f"{RED}No encrypted files found for project '{project_name}'.{RST}")
+
+def _skip_trash(tarinfo):
+    # Returning None for a directory also stops tarfile from descending into it
+    parts = tarinfo.name.split('/')
+    return None if len(parts) > 1 and is_trash(parts[1]) else tarinfo
 
 def compress_projects():
     """Compress the projects directory into a specified format."""
@@ -173,83 +530,149 @@ def compress_projects():
 
     compressed_filename = os.path.join(os.getcwd(), f"projects.{misleading_extension}")
 
-    print(f"{Fore.YELLOW}This tool will compress the projects folder. Make sure to upload the compressed file to the cloud.{Style.RESET_ALL}")
-    print(f"{Fore.YELLOW}The compressed file is safe to store and share.{Style.RESET_ALL}")
+    print(f"{YEL}This tool will compress the projects folder. Make sure to upload the compressed file to the cloud.{RST}")
+    print(f"{YEL}The compressed file is safe to store and share.{RST}")
 
     if compression_choice == "ZIP":
-        with zipfile.ZipFile(compressed_filename, 'w') as zipf:
-            for root, _, files in os.walk(PROJECTS_DIR):
+        with zipfile.ZipFile(compressed_filename, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=6, allowZip64=True) as zipf:
+            # os.walk yields roots that start with PROJECTS_DIR, so slicing gives the relative path
+            prefix_len = len(PROJECTS_DIR) + 1
+            for root, dirs, files in os.walk(PROJECTS_DIR, followlinks=False):
+                if root == PROJECTS_DIR:
+                    # Skip deleted projects, which a background thread may be removing right now
+                    dirs[:] = [name for name in dirs if not is_trash(name)]
+                rel_root = root[prefix_len:]
                 for file in files:
-                    zipf.write(os.path.join(root, file), os.path.relpath(os.path.join(root, file), PROJECTS_DIR))
-        print(f"{Fore.GREEN}Projects folder compressed successfully to '{compressed_filename}'.{Style.RESET_ALL}")
+                    file_path = os.path.join(root, file)
+                    zinfo = zipfile.ZipInfo.from_file(file_path, os.path.join(rel_root, file))
+                    # Hand the whole mapped file to the compressor instead of re-reading it in 8K chunks
+                    with read_buffer(file_path) as data:
+                        zipf.writestr(zinfo, data, compress_type=zipfile.ZIP_DEFLATED, compresslevel=6)
+        print(f"{GRN}Projects folder compressed successfully to '{compressed_filename}'.{RST}")
 
     elif compression_choice == "TAR":
-        with tarfile.open(compressed_filename, 'w:gz') as tarf:
-            tarf.add(PROJECTS_DIR, arcname=os.path.basename(PROJECTS_DIR))
-        print(f"{Fore.GREEN}Projects folder compressed successfully to '{compressed_filename}'.{Style.RESET_ALL}")
+        # Encrypted files barely compress, so the fastest gzip level loses almost nothing
+        with tarfile.open(compressed_filename, 'w:gz', compresslevel=1) as tarf:
+            tarf.add(PROJECTS_DIR, arcname=os.path.basename(PROJECTS_DIR), filter=_skip_trash)
+        print(f"{GRN}Projects folder compressed successfully to '{compressed_filename}'.{RST}")
+
+def detect_archive_format(path):
+    """Identify an archive from its leading magic bytes, ignoring its (possibly misleading) extension."""
+    with open(path, 'rb') as file:
+        head = file.read(6)
+    for signature, archive_format in ARCHIVE_SIGNATURES:
+        if head.startswith(signature):
+            return archive_format
+    return None
+
+def move_extracted(temp_dir):
+    """Move the entries of temp_dir into PROJECTS_DIR, then remove temp_dir.
+
+    Both directories are on the same filesystem, so each move is a single
+    rename. Entries that clash with existing projects are only replaced if
+    the user agrees, and are skipped otherwise. If a move fails, the moves
+    and replacements already made are undone as far as possible; any backup
+    that cannot be restored then is restored on the next start. Returns the
+    imported and the skipped names.
+    """
+    with os.scandir(temp_dir) as it:
+        names = [entry.name for entry in it]
+    clashes = [name for name in names if os.path.lexists(os.path.join(PROJECTS_DIR, name))]
+
+    replace = False
+    if clashes:
+        print(f"{YEL}Warning: The archive contains projects that already exist: {', '.join(clashes)}. Replacing them will delete their current files.{RST}")
+        replace_choice = input(f"{YEL}Do you want to replace them? (y/N) [{GRN}N{YEL}]: {RST}").strip().lower() or 'n'
+        replace = replace_choice == 'y'
+
+    skipped = []
+    moved = []
+    backups = []
+    try:
+        for name in names:
+            destination = os.path.join(PROJECTS_DIR, name)
+            if name in clashes:
+                if not replace:
+                    skipped.append(name)
+                    continue
+                # Keep the existing entry until the whole import has succeeded
+                backup = destination + IMPORT_BACKUP_MARKER + secrets.token_hex(4)
+                os.rename(destination, backup)
+                backups.append(backup)
+            os.replace(os.path.join(temp_dir, name), destination)
+            moved.append(name)
+    except BaseException:
+        # Hand imported entries back to temp_dir, then restore what they replaced.
+        # Each step is independent so one failure does not strand the other backups;
+        # a backup left behind is restored by ensure_projects_directory on the next start.
+        for name in reversed(moved):
+            try:
+                os.replace(os.path.join(PROJECTS_DIR, name), os.path.join(temp_dir, name))
+            except OSError:
+                pass
+        for backup in reversed(backups):
+            try:
+                restore_import_backup(backup)
+            except OSError:
+                pass
+        raise
+    finally:
+        invalidate_project_cache()
+
+    for backup in backups:
+        remove_entry(backup)
+    if skipped:
+        discard_directory(temp_dir)
+    else:
+        os.rmdir(temp_dir)
+    return moved, skipped
 
 def import_projects():
-    """Import projects from a compressed file with retry logic for misleading extensions."""
+    """Import projects from a compressed file, detecting its format from its contents."""
     compressed_file_path = inquirer.text(message="Enter the path of the compressed file to import:").execute()
 
     if not os.path.exists(compressed_file_path):
-        print(f"{Fore.RED}The specified file does not exist.{Style.RESET_ALL}")
+        print(f"{RED}The specified file does not exist.{RST}")
         return
 
-    # Try to extract directly first
-    def try_extract(path, ext):
+    def try_extract(path, archive_format):
+        # Extract to a uniquely named temp directory first, so no archive entry or project can clash with it
+        temp_dir = None
         try:
-            if ext == '.zip':
+            temp_dir = tempfile.mkdtemp(prefix=IMPORT_TEMP_PREFIX, dir=PROJECTS_DIR)
+            if archive_format == 'zip':
                 with zipfile.ZipFile(path, 'r') as zipf:
-                    # Extract to a temp directory first
-                    temp_dir = os.path.join(PROJECTS_DIR, 'temp')
-                    os.makedirs(temp_dir, exist_ok=True)
                     zipf.extractall(temp_dir)
-                    
-                    # Move files from the temp directory to PROJECTS_DIR, avoiding nested folders
-                    for item in os.listdir(temp_dir):
-                        source = os.path.join(temp_dir, item)
-                        destination = os.path.join(PROJECTS_DIR, item)
-                        shutil.move(source, destination)
-
-                    # Cleanup the temp directory
-                    shutil.rmtree(temp_dir)
-                    
-                print(f"{Fore.GREEN}Projects imported successfully from '{path}' as ZIP.{Style.RESET_ALL}")
-                return True
-            
-            elif ext == '.tar.gz' or ext == '.tgz':
-                with tarfile.open(path, 'r:gz') as tarf:
-                    temp_dir = os.path.join(PROJECTS_DIR, 'temp')
-                    os.makedirs(temp_dir, exist_ok=True)
-                    tarf.extractall(temp_dir)
-
-                    for item in os.listdir(temp_dir):
-                        source = os.path.join(temp_dir, item)
-                        destination = os.path.join(PROJECTS_DIR, item)
-                        shutil.move(source, destination)
-
-                    shutil.rmtree(temp_dir)
-
-                print(f"{Fore.GREEN}Projects imported successfully from '{path}' as TAR.{Style.RESET_ALL}")
-                return True
+            else:
+                with tarfile.open(path, 'r:' + archive_format) as tarf:
+                    if hasattr(tarfile, 'data_filter'):
+                        tarf.extractall(temp_dir, filter='data')  # Rejects absolute paths and '..' members
+                    else:
+                        tarf.extractall(temp_dir)
+
+            # Move entries from the temp directory to PROJECTS_DIR, avoiding nested folders
+            imported, skipped = move_extracted(temp_dir)
+            if imported:
+                print(f"{GRN}Projects imported successfully from '{path}' as {'ZIP' if archive_format == 'zip' else 'TAR'}.{RST}")
+            else:
+                print(f"{YEL}Nothing was imported from '{path}'.{RST}")
+            if skipped:
+                print(f"{YEL}Skipped existing projects: {', '.join(skipped)}.{RST}")
+            return True
 
         except Exception as e:
-            print(f"{Fore.YELLOW}Failed to extract '{path}': {e}{Style.RESET_ALL}")
+            print(f"{YEL}Failed to extract '{path}': {e}{RST}")
+            if temp_dir is not None and os.path.isdir(temp_dir):
+                discard_directory(temp_dir)
         return False
 
-
-    # First attempt: Try extracting the file as is (even with misleading extension)
-    if try_extract(compressed_file_path, '.zip') or try_extract(compressed_file_path, '.tar.gz'):
-        return
-
-    # Attempt to guess the correct format by stripping the misleading extension and retrying
-    base_path = os.path.splitext(compressed_file_path)[0]
-    
-    if try_extract(base_path + '.zip', '.zip') or try_extract(base_path + '.tar.gz', '.tar.gz'):
+    archive_format = detect_archive_format(compressed_file_path)
+    if archive_format is None:
+        print(f"{RED}'{compressed_file_path}' is not a ZIP or TAR archive. Please check the file format and try again.{RST}")
         return
 
-    print(f"{Fore.RED}All extraction attempts failed. Please check the file format and try again.{Style.RESET_ALL}")
+    if not try_extract(compressed_file_path, archive_format):
+        print(f"{RED}Extraction failed. Please check the file and try again.{RST}")
 
 
  
@@ -257,10 +680,11 @@ def choose_project():
     """Prompt the user to select a project from the list."""
     projects = list_projects()
     if not projects:
-        print(f"{Fore.RED}No projects available.{Style.RESET_ALL}")
+        print(f"{RED}No projects available.{RST}")
         return None
     
-    return inquirer.select(message="Select a project:", choices=projects).execute()
+    # Fuzzy matching lets the user narrow down long project lists by typing
+    return inquirer.fuzzy(message="Select a project:", choices=projects).execute()
 
 def display_menu():
     """Display the main menu and get user choice."""
@@ -290,11 +714,9 @@ def main():
         elif choice == "Decrypt an encrypted .env file":
             project_name = choose_project()
             if project_name:
-                password = getpass(f"{Fore.YELLOW}Enter the password to decrypt: {Style.RESET_ALL}")
-                for ext in ENV_EXTENSIONS:
-                    file_to_decrypt = os.path.join(PROJECTS_DIR, project_name, ext + '.encrypted')
-                    if os.path.exists(file_to_decrypt):
-                        decrypt_file(file_to_decrypt, password)
+                password = getpass(f"{YEL}Enter the password to decrypt: {RST}")
+                files_to_decrypt = scan_env_files(os.path.join(PROJECTS_DIR, project_name), ENV_ENC_SET)
+                decrypt_files([entry.path for entry in files_to_decrypt], password)
 
         elif choice == "View encrypted files in a project":
             project_name = choose_project()
@@ -313,9 +735,11 @@ def main():
             import_projects()
 
         elif choice == "Exit":
-            print(f"{Fore.CYAN}Exiting...{Style.RESET_ALL}")
+            clear_key_cache()
+            print(f"{CYN}Exiting...{RST}")
             break
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # Needed for worker processes in the PyInstaller build
     main()